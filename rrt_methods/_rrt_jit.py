@@ -0,0 +1,287 @@
+# _rrt_jit.py
+# Author: Joao Lucas
+# Created: 29.08.2026
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _is_free(x, y, circles, poly_verts, poly_counts):
+    """
+    Checks whether a point lies outside every packed obstacle
+    * x: x coordinate of the point
+    * y: y coordinate of the point
+    * circles: (Nc, 3) array of circle center x, center y and radius
+    * poly_verts: (Np, Mv, 2) array of padded polygon vertices
+    * poly_counts: (Np,) array of valid vertex counts per polygon
+    """
+    for i in range(circles.shape[0]):
+        dx = x - circles[i, 0]
+        dy = y - circles[i, 1]
+
+        if dx * dx + dy * dy <= circles[i, 2] * circles[i, 2]:
+            return False
+
+    for p in range(poly_verts.shape[0]):
+        count = poly_counts[p]
+        inside = False
+        j = count - 1
+
+        for i in range(count):
+            xi = poly_verts[p, i, 0]
+            yi = poly_verts[p, i, 1]
+            xj = poly_verts[p, j, 0]
+            yj = poly_verts[p, j, 1]
+
+            if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+                inside = not inside
+
+            j = i
+
+        if inside:
+            return False
+
+    return True
+
+
+def _segment_free(px, py, qx, qy, circles, poly_verts, poly_counts):
+    """
+    Checks whether the segment from p to q stays outside every packed
+    obstacle: clamped projection against the circles and edge-crossing
+    orientation tests against the polygons. The endpoints' containment is
+    the caller's responsibility
+    * px: x coordinate of the segment's start
+    * py: y coordinate of the segment's start
+    * qx: x coordinate of the segment's end
+    * qy: y coordinate of the segment's end
+    * circles: (Nc, 3) array of circle center x, center y and radius
+    * poly_verts: (Np, Mv, 2) array of padded polygon vertices
+    * poly_counts: (Np,) array of valid vertex counts per polygon
+    """
+    dx = qx - px
+    dy = qy - py
+    length2 = dx * dx + dy * dy
+
+    for i in range(circles.shape[0]):
+        t = 0.0
+
+        if length2 > 0.0:
+            t = ((circles[i, 0] - px) * dx + (circles[i, 1] - py) * dy) / length2
+
+            if t < 0.0:
+                t = 0.0
+
+            elif t > 1.0:
+                t = 1.0
+
+        ex = px + t * dx - circles[i, 0]
+        ey = py + t * dy - circles[i, 1]
+
+        if ex * ex + ey * ey <= circles[i, 2] * circles[i, 2]:
+            return False
+
+    for p in range(poly_verts.shape[0]):
+        count = poly_counts[p]
+        j = count - 1
+
+        for i in range(count):
+            xi = poly_verts[p, i, 0]
+            yi = poly_verts[p, i, 1]
+            xj = poly_verts[p, j, 0]
+            yj = poly_verts[p, j, 1]
+
+            d1 = dx * (yi - py) - dy * (xi - px)
+            d2 = dx * (yj - py) - dy * (xj - px)
+            d3 = (xj - xi) * (py - yi) - (yj - yi) * (px - xi)
+            d4 = (xj - xi) * (qy - yi) - (yj - yi) * (qx - xi)
+
+            if ((d1 > 0.0) != (d2 > 0.0)) and ((d3 > 0.0) != (d4 > 0.0)):
+                return False
+
+            j = i
+
+    return True
+
+
+def _plan(
+    start_x,
+    start_y,
+    goal_x,
+    goal_y,
+    circles,
+    poly_verts,
+    poly_counts,
+    width,
+    height,
+    max_it,
+    delta,
+    goal_bias,
+    eps,
+    seed,
+):
+    """
+    Runs the whole RRT planning loop over packed arrays, mirroring
+    RRT.plan_path: sample (goal-biased), extend the nearest node by at most
+    delta, drop colliding extensions, stop within eps of the goal. Returns
+    the coordinate array, the parent-index array and the node count
+    * start_x: x coordinate of the root node
+    * start_y: y coordinate of the root node
+    * goal_x: x coordinate of the goal
+    * goal_y: y coordinate of the goal
+    * circles: (Nc, 3) array of circle center x, center y and radius
+    * poly_verts: (Np, Mv, 2) array of padded polygon vertices
+    * poly_counts: (Np,) array of valid vertex counts per polygon
+    * width: width of the field
+    * height: height of the field
+    * max_it: maximum number of iterations
+    * delta: maximum extension distance
+    * goal_bias: probability of sampling the goal instead of the field
+    * eps: goal distance threshold
+    * seed: seed of the random number generator
+    """
+    coords = np.empty((max_it + 1, 2))
+    parents = np.full(max_it + 1, -1, dtype=np.int32)
+    coords[0, 0] = start_x
+    coords[0, 1] = start_y
+    n = 1
+
+    eps2 = eps * eps
+    np.random.seed(seed)
+
+    for _ in range(max_it):
+        if np.random.random() < goal_bias:
+            rx = goal_x
+            ry = goal_y
+
+        else:
+            # Rejection-sample the free space, like _sample_free_space
+            while True:
+                rx = np.random.random() * width
+                ry = np.random.random() * height
+
+                if _is_free(rx, ry, circles, poly_verts, poly_counts):
+                    break
+
+        best = 0
+        best_d2 = np.inf
+
+        for i in range(n):
+            d2 = (coords[i, 0] - rx) ** 2 + (coords[i, 1] - ry) ** 2
+
+            if d2 < best_d2:
+                best_d2 = d2
+                best = i
+
+        dx = rx - coords[best, 0]
+        dy = ry - coords[best, 1]
+        distance = math.sqrt(dx * dx + dy * dy)
+
+        if distance > delta:
+            scale = delta / distance
+            ex = coords[best, 0] + dx * scale
+            ey = coords[best, 1] + dy * scale
+
+        else:
+            ex = rx
+            ey = ry
+
+        if not _is_free(ex, ey, circles, poly_verts, poly_counts):
+            continue
+
+        if not _segment_free(
+            coords[best, 0],
+            coords[best, 1],
+            ex,
+            ey,
+            circles,
+            poly_verts,
+            poly_counts,
+        ):
+            continue
+
+        coords[n, 0] = ex
+        coords[n, 1] = ey
+        parents[n] = best
+        n += 1
+
+        gdx = ex - goal_x
+        gdy = ey - goal_y
+
+        if gdx * gdx + gdy * gdy < eps2:
+            break
+
+    return coords, parents, n
+
+
+def _plan_multi(
+    start_x,
+    start_y,
+    goal_x,
+    goal_y,
+    circles,
+    poly_verts,
+    poly_counts,
+    width,
+    height,
+    max_it,
+    delta,
+    goal_bias,
+    eps,
+    seeds,
+):
+    """
+    Runs one independent plan per seed — in parallel threads under numba's
+    prange, sequentially otherwise — and returns the stacked coordinate and
+    parent arrays plus each run's node count. The caller picks the winner
+    * seeds: (K,) array of random number generator seeds, one per run
+    Remaining parameters are those of _plan
+    """
+    runs = seeds.shape[0]
+    all_coords = np.empty((runs, max_it + 1, 2))
+    all_parents = np.full((runs, max_it + 1), -1, dtype=np.int32)
+    counts = np.empty(runs, dtype=np.int64)
+
+    for k in prange(runs):
+        coords, parents, n = _plan(
+            start_x,
+            start_y,
+            goal_x,
+            goal_y,
+            circles,
+            poly_verts,
+            poly_counts,
+            width,
+            height,
+            max_it,
+            delta,
+            goal_bias,
+            eps,
+            seeds[k],
+        )
+        all_coords[k] = coords
+        all_parents[k] = parents
+        counts[k] = n
+
+    return all_coords, all_parents, counts
+
+
+if njit is not None:
+    _is_free = njit(cache=True)(_is_free)
+    _segment_free = njit(cache=True)(_segment_free)
+    _plan = njit(cache=True)(_plan)
+    plan = _plan
+    plan_multi = njit(cache=True, parallel=True)(_plan_multi)
+
+else:
+    plan = None
+    plan_multi = _plan_multi
@@ -4,11 +4,17 @@
 
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+from typing import TYPE_CHECKING
 
+import numpy as np
+
+from rrt_methods.obstacles.circle import Circle
 from rrt_methods.obstacles.obstacle import Obstacle
+from rrt_methods.obstacles.polygon import Polygon
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
 
 
 class Field:
@@ -20,10 +26,28 @@ class Field:
         self.shape = shape
         self.obstacles = list[Obstacle]()
 
+        # Structure-of-arrays cache of the circle obstacles, so that distance
+        # queries over them run as one vectorized pass instead of a Python loop
+        self._circle_cx: np.ndarray = np.empty(0)
+        self._circle_cy: np.ndarray = np.empty(0)
+        self._circle_r: np.ndarray = np.empty(0)
+        self._other_obstacles: list[Obstacle] = []
+
+        # Packed (N, 4) array of obstacle bounding boxes (minx, miny, maxx,
+        # maxy), used as a broad phase so point queries only visit obstacles
+        # whose box is near the point
+        self._bboxes: np.ndarray = np.empty((0, 4))
+
+        # Lazily built R-tree over the obstacles, invalidated by add_obstacle
+        self._rtree = None
+
+        # Rasterized free-space mask built on demand by build_free_mask and
+        # dropped whenever an obstacle is added
+        self._free_mask: np.ndarray | None = None
+
     @staticmethod
     def __main__():
-        from rrt_methods.obstacles.circle import Circle
-        from rrt_methods.obstacles.polygon import Polygon
+        import matplotlib.pyplot as plt
 
         fig, ax = plt.subplots()
         field = (
@@ -32,7 +56,6 @@ class Field:
             .add_obstacle(Polygon([(6, 6), (6, 8), (8, 8), (8, 6)]))
         )
         field.plot(fig, ax)
-        ax.autoscale_view()
         plt.show()
 
     # -------------------------------------------------------------------------------- #
@@ -45,8 +68,113 @@ class Field:
         * obstacle: obstacle to add
         """
         self.obstacles.append(obstacle)
+
+        if isinstance(obstacle, Circle):
+            self._circle_cx = np.append(self._circle_cx, obstacle.cx)
+            self._circle_cy = np.append(self._circle_cy, obstacle.cy)
+            self._circle_r = np.append(self._circle_r, obstacle.r)
+
+        else:
+            self._other_obstacles.append(obstacle)
+
+        # Obstacles without a precomputed box get an unbounded one, so they
+        # are never pruned by the broad phase
+        inf = float("inf")
+        bbox = getattr(obstacle, "bbox", (-inf, -inf, inf, inf))
+        self._bboxes = np.vstack([self._bboxes, bbox])
+
+        self._rtree = None
+        self._free_mask = None
         return self
 
+    def build_free_mask(self, resolution: int = 512) -> np.ndarray:
+        """
+        Rasterizes the field's free space into a (resolution, resolution)
+        boolean mask evaluated at cell centers, so collision checks become a
+        single array lookup instead of a per-obstacle scan. The lookup is
+        quantized to the cell size (~2 cm on a 10 m field at the default
+        resolution), so use the exact obstacle tests where that matters
+        * resolution: number of cells along each axis
+        """
+        if self._free_mask is None or self._free_mask.shape[0] != resolution:
+            half_dx = self.shape[0] / resolution / 2
+            half_dy = self.shape[1] / resolution / 2
+            grid_x, grid_y = np.meshgrid(
+                np.linspace(half_dx, self.shape[0] - half_dx, resolution),
+                np.linspace(half_dy, self.shape[1] - half_dy, resolution),
+            )
+            pts = np.column_stack([grid_x.ravel(), grid_y.ravel()])
+
+            free = np.ones(pts.shape[0], dtype=bool)
+            for obstacle in self.obstacles:
+                free &= obstacle.distance_batch(pts) > 0
+
+            self._free_mask = free.reshape(resolution, resolution)
+
+        return self._free_mask
+
+    def obstacles_near(self, x: float, y: float, r: float = 0.0) -> list[Obstacle]:
+        """
+        Returns the obstacles whose bounding box, inflated by r, contains the
+        point, with one vectorized overlap test over the packed bbox array.
+        Obstacles outside the returned list are guaranteed farther than r
+        * x: x coordinate of the point
+        * y: y coordinate of the point
+        * r: inflation radius around each bounding box
+        """
+        if self._bboxes.shape[0] == 0:
+            return []
+
+        near = (
+            (x >= self._bboxes[:, 0] - r)
+            & (x <= self._bboxes[:, 2] + r)
+            & (y >= self._bboxes[:, 1] - r)
+            & (y <= self._bboxes[:, 3] + r)
+        )
+
+        return [self.obstacles[i] for i in np.nonzero(near)[0]]
+
+    def nearest_obstacle_distance(self, x: float, y: float) -> float:
+        """
+        Calculates the distance from a point to the nearest obstacle using an
+        R-tree over the obstacles, giving sublinear queries on obstacle-dense
+        fields
+        * x: x coordinate of the point
+        * y: y coordinate of the point
+        """
+        if not self.obstacles:
+            return float("inf")
+
+        import shapely.geometry as geo
+
+        self._ensure_index()
+        nearest = int(self._rtree.nearest(geo.Point(x, y)))  # type: ignore
+        return self.obstacles[nearest].distance(x, y)
+
+    def min_distance(self, x: float, y: float) -> float:
+        """
+        Calculates the minimum distance from a point to any obstacle in the field.
+        Circles are evaluated in a single vectorized expression; other obstacle
+        types fall back to their own distance method
+        * x: x coordinate of the point
+        * y: y coordinate of the point
+        """
+        minimum = float("inf")
+
+        if self._circle_cx.shape[0] > 0:
+            minimum = float(
+                np.maximum(
+                    np.hypot(self._circle_cx - x, self._circle_cy - y)
+                    - self._circle_r,
+                    0.0,
+                ).min()
+            )
+
+        for obstacle in self._other_obstacles:
+            minimum = min(minimum, obstacle.distance(x, y))
+
+        return minimum
+
     def plot(self, fig: Figure, ax: Axes) -> None:
         """
         Plots the field in the figure
@@ -65,8 +193,73 @@ class Field:
             [0, self.shape[1]],
             color="black",
         )
-        for obstacle in self.obstacles:
-            obstacle.plot(fig, ax)
+        for collection in self._collect_patches(ax):
+            ax.add_collection(collection)
+
+        # Obstacle types without a batched collection draw themselves
+        for obstacle in self._other_obstacles:
+            if not isinstance(obstacle, Polygon):
+                obstacle.plot(fig, ax)
+
+        # Relayout once after all obstacles are added, instead of per obstacle
+        ax.autoscale_view()
+
+    # -------------------------------------------------------------------------------- #
+    # Private Methods
+    # -------------------------------------------------------------------------------- #
+    def _collect_patches(self, ax: Axes) -> list:
+        """
+        Builds one matplotlib collection per obstacle type, so that the figure
+        holds a single artist per type instead of one artist per obstacle
+        * ax: matplotlib Axes object (1 axis)
+        """
+        from matplotlib.collections import EllipseCollection, PatchCollection
+        from matplotlib.patches import Polygon as PolygonPatch
+
+        collections: list = []
+
+        if self._circle_cx.shape[0] > 0:
+            collections.append(
+                EllipseCollection(
+                    widths=2 * self._circle_r,
+                    heights=2 * self._circle_r,
+                    angles=0,
+                    units="xy",
+                    offsets=np.stack([self._circle_cx, self._circle_cy], axis=1),
+                    offset_transform=ax.transData,
+                    facecolor="blue",
+                    edgecolor="black",
+                )
+            )
+
+        polygon_patches = [
+            PolygonPatch(obstacle.points)
+            for obstacle in self._other_obstacles
+            if isinstance(obstacle, Polygon)
+        ]
+        if polygon_patches:
+            collections.append(
+                PatchCollection(
+                    polygon_patches,
+                    facecolor="blue",
+                    edgecolor="black",
+                )
+            )
+
+        return collections
+
+    def _ensure_index(self) -> None:
+        """
+        Builds the R-tree over the obstacles' cached shapely geometries if it
+        has not been built since the last add_obstacle
+        """
+        if self._rtree is None:
+            from shapely import STRtree
+
+            self._rtree = STRtree(
+                [obstacle.shapely_geometry() for obstacle in self.obstacles]
+            )
+
 
 if __name__ == "__main__":
     Field.__main__()
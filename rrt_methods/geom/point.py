@@ -0,0 +1,18 @@
+# point.py
+# Author: Joao Lucas
+# Created: 29.08.2026
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class Point(NamedTuple):
+    """
+    Lightweight (x, y) point. Being a tuple subclass it can be passed anywhere
+    a coordinate tuple is expected, while giving named access to the fields
+    without any per-call array construction
+    """
+
+    x: float
+    y: float
@@ -0,0 +1,63 @@
+# _circle_kernels.py
+# Author: Joao Lucas
+# Created: 29.08.2026
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+except ImportError:
+    njit = None
+
+
+def _circle_distances_py(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    cx: float,
+    cy: float,
+    r: float,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized NumPy fallback used when numba is not installed
+    * xs: x coordinates of the query points
+    * ys: y coordinates of the query points
+    * cx: x coordinate of the circle's center
+    * cy: y coordinate of the circle's center
+    * r: radius of the circle
+    * out: preallocated output array of the same length as xs
+    """
+    np.hypot(xs - cx, ys - cy, out=out)
+    out -= r
+    np.maximum(out, 0.0, out=out)
+    return out
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def circle_distances(xs, ys, cx, cy, r, out):  # pragma: no cover
+        """
+        Batched circle distance kernel, compiled by numba to a tight loop
+        * xs: x coordinates of the query points
+        * ys: y coordinates of the query points
+        * cx: x coordinate of the circle's center
+        * cy: y coordinate of the circle's center
+        * r: radius of the circle
+        * out: preallocated output array of the same length as xs
+        """
+        for i in range(xs.shape[0]):
+            dx = xs[i] - cx
+            dy = ys[i] - cy
+            d = math.sqrt(dx * dx + dy * dy) - r
+            out[i] = d if d > 0.0 else 0.0
+
+        return out
+
+else:
+    circle_distances = _circle_distances_py
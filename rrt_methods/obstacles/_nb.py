@@ -0,0 +1,101 @@
+# _nb.py
+# Author: Joao Lucas
+# Created: 29.08.2026
+
+from __future__ import annotations
+
+import math
+
+try:
+    from numba import float64
+    from numba.experimental import jitclass
+
+except ImportError:
+    float64 = None
+    jitclass = None
+
+
+class _CircleSF:
+    """
+    Support-function view of a circle obstacle, holding only plain floats so
+    that numba-compiled planner loops can call it without Python dispatch
+    """
+
+    def __init__(self, cx, cy, r):
+        self.cx = cx
+        self.cy = cy
+        self.r = r
+        self.r2 = r * r
+
+    def distance(self, x, y):
+        d = math.hypot(x - self.cx, y - self.cy) - self.r
+        return d if d > 0.0 else 0.0
+
+    def contains(self, x, y):
+        dx = x - self.cx
+        dy = y - self.cy
+        return dx * dx + dy * dy <= self.r2
+
+
+class _PolygonSF:
+    """
+    Support-function view of a polygon obstacle over contiguous vertex arrays,
+    with the signed-distance and ray-cast kernels inlined for numba
+    """
+
+    def __init__(self, xs, ys):
+        self.xs = xs
+        self.ys = ys
+
+    def distance(self, x, y):
+        n = self.xs.shape[0]
+        distance = math.inf
+        inside = False
+
+        for i in range(n):
+            x0 = self.xs[i]
+            y0 = self.ys[i]
+            x1 = self.xs[(i + 1) % n]
+            y1 = self.ys[(i + 1) % n]
+
+            ex = x1 - x0
+            ey = y1 - y0
+            t = ((x - x0) * ex + (y - y0) * ey) / max(ex * ex + ey * ey, 1e-300)
+            t = min(max(t, 0.0), 1.0)
+            dx = x - (x0 + t * ex)
+            dy = y - (y0 + t * ey)
+            d = math.sqrt(dx * dx + dy * dy)
+
+            if d < distance:
+                distance = d
+
+            if (y0 > y) != (y1 > y) and x < (x1 - x0) * (y - y0) / (y1 - y0) + x0:
+                inside = not inside
+
+        return 0.0 if inside else distance
+
+    def contains(self, x, y):
+        n = self.xs.shape[0]
+        inside = False
+
+        for i in range(n):
+            x0 = self.xs[i]
+            y0 = self.ys[i]
+            x1 = self.xs[(i + 1) % n]
+            y1 = self.ys[(i + 1) % n]
+
+            if (y0 > y) != (y1 > y) and x < (x1 - x0) * (y - y0) / (y1 - y0) + x0:
+                inside = not inside
+
+        return inside
+
+
+if jitclass is not None:
+    CircleSF = jitclass(
+        [("cx", float64), ("cy", float64), ("r", float64), ("r2", float64)]
+    )(_CircleSF)
+    PolygonSF = jitclass([("xs", float64[:]), ("ys", float64[:])])(_PolygonSF)
+
+else:
+    CircleSF = _CircleSF
+    PolygonSF = _PolygonSF
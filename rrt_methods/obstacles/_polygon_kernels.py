@@ -0,0 +1,92 @@
+# _polygon_kernels.py
+# Author: Joao Lucas
+# Created: 29.08.2026
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+except ImportError:
+    njit = None
+
+
+def _poly_sdf_py(xs: np.ndarray, ys: np.ndarray, px: float, py: float) -> float:
+    """
+    Vectorized NumPy fallback used when numba is not installed
+    * xs: x coordinates of the polygon's vertices
+    * ys: y coordinates of the polygon's vertices
+    * px: x coordinate of the query point
+    * py: y coordinate of the query point
+    """
+    xs1 = np.roll(xs, -1)
+    ys1 = np.roll(ys, -1)
+
+    # Minimum distance to the edge segments via clamped projection
+    ex = xs1 - xs
+    ey = ys1 - ys
+    t = np.clip(
+        ((px - xs) * ex + (py - ys) * ey) / np.maximum(ex * ex + ey * ey, 1e-300),
+        0.0,
+        1.0,
+    )
+    distance = float(np.hypot(px - (xs + t * ex), py - (ys + t * ey)).min())
+
+    # PNPOLY-style ray cast for the sign
+    crossing = (ys > py) != (ys1 > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inside = bool(
+            np.logical_xor.reduce(
+                crossing & (px < (xs1 - xs) * (py - ys) / (ys1 - ys) + xs)
+            )
+        )
+
+    return -distance if inside else distance
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def poly_sdf(xs, ys, px, py):  # pragma: no cover
+        """
+        Signed distance from a point to a simple polygon, compiled by numba:
+        negative inside, positive outside
+        * xs: x coordinates of the polygon's vertices
+        * ys: y coordinates of the polygon's vertices
+        * px: x coordinate of the query point
+        * py: y coordinate of the query point
+        """
+        n = xs.shape[0]
+        distance = np.inf
+        inside = False
+
+        for i in range(n):
+            x0 = xs[i]
+            y0 = ys[i]
+            x1 = xs[(i + 1) % n]
+            y1 = ys[(i + 1) % n]
+
+            # Distance to the edge segment via clamped projection
+            ex = x1 - x0
+            ey = y1 - y0
+            t = ((px - x0) * ex + (py - y0) * ey) / max(ex * ex + ey * ey, 1e-300)
+            t = min(max(t, 0.0), 1.0)
+            dx = px - (x0 + t * ex)
+            dy = py - (y0 + t * ey)
+            d = math.sqrt(dx * dx + dy * dy)
+
+            if d < distance:
+                distance = d
+
+            # PNPOLY-style ray cast for the sign
+            if (y0 > py) != (y1 > py) and px < (x1 - x0) * (py - y0) / (y1 - y0) + x0:
+                inside = not inside
+
+        return -distance if inside else distance
+
+else:
+    poly_sdf = _poly_sdf_py
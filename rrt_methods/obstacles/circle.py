@@ -4,16 +4,23 @@
 
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
+import math
+from typing import TYPE_CHECKING
+
 import numpy as np
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
 
+from rrt_methods.obstacles._circle_kernels import circle_distances
 from rrt_methods.obstacles.obstacle import Obstacle
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
+
 
 class Circle(Obstacle):
 
+    __slots__ = ("center", "r", "cx", "cy", "r2", "bbox", "_center_arr", "_shapely", "_support")
+
     def __init__(self, center: tuple[float, float], r: float) -> None:
         """
         Class that represents a circle obstacle
@@ -23,8 +30,25 @@ class Circle(Obstacle):
         self.center = center
         self.r = r
 
+        # Scalar caches so that distance queries in the RRT inner loop avoid
+        # rebuilding tuples and arrays on every call
+        self.cx: float = center[0]
+        self.cy: float = center[1]
+        self.r2: float = r * r
+        self.bbox: tuple[float, float, float, float] = (
+            self.cx - r,
+            self.cy - r,
+            self.cx + r,
+            self.cy + r,
+        )
+        self._center_arr = np.asarray(center, dtype=np.float64)
+        self._shapely = None
+        self._support = None
+
     @staticmethod
     def __main__():
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots()
         ax.set_title("Circle")
         circle = Circle((3, 3), 2)
@@ -41,6 +65,8 @@ class Circle(Obstacle):
         Plots the circle in the figure
         * ax: pyplot's axes (1 axis)
         """
+        import matplotlib.pyplot as plt
+
         ax.add_patch(
             plt.Circle(  # type: ignore
                 self.center,
@@ -50,13 +76,93 @@ class Circle(Obstacle):
             )
         )
 
-    def distance(self, point: tuple[float, float]) -> float:
+    def distance(self, x: float, y: float) -> float:
         """
         Calculates a point's distance to the circle
-        * point: x and y coordinates of the point
+        * x: x coordinate of the point
+        * y: y coordinate of the point
+        """
+        d = math.hypot(x - self.cx, y - self.cy) - self.r
+        return d if d > 0.0 else 0.0
+
+    def distance_batch(self, pts: np.ndarray) -> np.ndarray:
+        """
+        Calculates the distances from a batch of points to the circle in a single
+        vectorized (numba-compiled when available) call
+        * pts: (N, 2) array of x and y coordinates
+        """
+        xs = np.ascontiguousarray(pts[:, 0], dtype=np.float64)
+        ys = np.ascontiguousarray(pts[:, 1], dtype=np.float64)
+        out = np.empty(xs.shape[0], dtype=np.float64)
+        return circle_distances(xs, ys, self.cx, self.cy, self.r, out)
+
+    def shapely_geometry(self):
+        """
+        Returns a cached shapely geometry representing the circle, built lazily
+        on first use
+        """
+        if self._shapely is None:
+            import shapely.geometry as geo
+
+            self._shapely = geo.Point(self.cx, self.cy).buffer(self.r)
+
+        return self._shapely
+
+    def as_support(self):
+        """
+        Returns a cached support-function view of the circle, usable from
+        numba-compiled planner loops
+        """
+        if self._support is None:
+            from rrt_methods.obstacles._nb import CircleSF
+
+            self._support = CircleSF(self.cx, self.cy, self.r)
+
+        return self._support
+
+    def intersects_segment(
+        self, p: tuple[float, float], q: tuple[float, float]
+    ) -> bool:
+        """
+        Checks whether the segment from p to q intersects the circle, via the
+        closed-form distance from the center to the segment
+        * p: x and y coordinates of the segment's start
+        * q: x and y coordinates of the segment's end
+        """
+        px, py = p
+        ex = q[0] - px
+        ey = q[1] - py
+        t = ((self.cx - px) * ex + (self.cy - py) * ey) / max(
+            ex * ex + ey * ey, 1e-300
+        )
+        t = min(max(t, 0.0), 1.0)
+        dx = self.cx - (px + t * ex)
+        dy = self.cy - (py + t * ey)
+        return dx * dx + dy * dy <= self.r2
+
+    def is_free(self, x: float, y: float, margin: float = 0.0) -> bool:
+        """
+        Checks whether a point lies at least margin away from the circle,
+        comparing squared distances to skip the square root
+        * x: x coordinate of the point
+        * y: y coordinate of the point
+        * margin: minimum clearance for the point to be considered free
+        """
+        dx = x - self.cx
+        dy = y - self.cy
+        inflated = self.r + margin
+        return dx * dx + dy * dy > inflated * inflated
+
+    def collides(self, x: float, y: float) -> bool:
+        """
+        Checks whether a point lies inside the circle, skipping the square root
+        needed by `distance`
+        * x: x coordinate of the point
+        * y: y coordinate of the point
         """
-        center_dist = np.linalg.norm(np.array(point) - np.array(self.center))
-        return float(np.max([center_dist - self.r, 0.0]))
+        dx = x - self.cx
+        dy = y - self.cy
+        return dx * dx + dy * dy <= self.r2
 
 
 if __name__ == "__main__":
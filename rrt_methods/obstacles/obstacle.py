@@ -5,13 +5,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
 
 
 class Obstacle(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self) -> None:
         """
@@ -36,10 +40,57 @@ class Obstacle(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def distance(self, point: tuple[float, float]) -> float:
+    def distance(self, x: float, y: float) -> float:
         """
         Calculates a point's distance to the obstacle
-        * point: x and y coordinates of the point
+        * x: x coordinate of the point
+        * y: y coordinate of the point
+        """
+        raise NotImplementedError()
+
+    def distance_batch(self, pts):
+        """
+        Calculates the distances from a batch of points to the obstacle.
+        Subclasses override this with vectorized kernels; the base
+        implementation falls back to the scalar distance per point
+        * pts: (N, 2) array of x and y coordinates
+        """
+        import numpy as np
+
+        return np.array([self.distance(x, y) for x, y in pts])
+
+    def intersects_segment(self, p, q) -> bool:
+        """
+        Checks whether the segment from p to q intersects the obstacle.
+        Subclasses override this with exact geometric tests; the base
+        implementation checks eight interpolated samples in one batched
+        distance call
+        * p: x and y coordinates of the segment's start
+        * q: x and y coordinates of the segment's end
+        """
+        import numpy as np
+
+        ts = np.linspace(0.0, 1.0, 8)
+        pts = np.column_stack(
+            [p[0] + ts * (q[0] - p[0]), p[1] + ts * (q[1] - p[1])]
+        )
+        return bool((self.distance_batch(pts) <= 0.0).any())
+
+    def is_free(self, x: float, y: float, margin: float = 0.0) -> bool:
+        """
+        Checks whether a point lies at least margin away from the obstacle.
+        Subclasses override this with cheaper specialized predicates
+        * x: x coordinate of the point
+        * y: y coordinate of the point
+        * margin: minimum clearance for the point to be considered free
+        """
+        return self.distance(x, y) > margin
+
+    @abstractmethod
+    def shapely_geometry(self):
+        """
+        Returns a cached shapely geometry representing the obstacle, used to
+        build spatial indexes over the obstacles of a field
         """
         raise NotImplementedError()
 
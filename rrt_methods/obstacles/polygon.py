@@ -4,25 +4,84 @@
 
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
-import shapely.geometry as geo
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+from typing import TYPE_CHECKING
 
+import numpy as np
+
+from rrt_methods.obstacles._polygon_kernels import poly_sdf
 from rrt_methods.obstacles.obstacle import Obstacle
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
+
 
 class Polygon(Obstacle):
+
+    __slots__ = (
+        "points",
+        "_poly",
+        "_xs",
+        "_ys",
+        "_xs1",
+        "_ys1",
+        "_simple",
+        "minx",
+        "miny",
+        "maxx",
+        "maxy",
+        "bbox",
+        "_edges",
+        "_bounds",
+        "_prepared",
+        "_support",
+    )
+
     def __init__(self, points: list[tuple[float, float]]) -> None:
         """
         Class that represents a polygon obstacle
         * points: list of x and y coordinates of the polygon's contour
         """
         self.points = points
-        self.poly = geo.Polygon(points)
+
+        # Contiguous vertex arrays for the signed-distance kernel; shapely is
+        # kept only as a fallback for non-simple polygons and is loaded lazily
+        # so that planning-only runs never import it
+        points_arr = np.asarray(points, dtype=np.float64)
+        self._xs, self._ys = points_arr.T.copy()
+        self._xs1 = np.roll(self._xs, -1)
+        self._ys1 = np.roll(self._ys, -1)
+        self._simple: bool | None = None
+
+        # Axis-aligned bounding box, used as a broad-phase filter so that
+        # queries far from the polygon skip the exact distance computation
+        self.minx, self.miny = points_arr.min(axis=0)
+        self.maxx, self.maxy = points_arr.max(axis=0)
+        self._bounds: tuple[float, float, float, float] = (
+            self.minx,
+            self.miny,
+            self.maxx,
+            self.maxy,
+        )
+        self.bbox: tuple[float, float, float, float] = self._bounds
+
+        # (E, 2, 2) array of edge segments for vectorized edge kernels
+        self._edges = np.stack(
+            [
+                np.column_stack([self._xs, self._ys]),
+                np.column_stack([self._xs1, self._ys1]),
+            ],
+            axis=1,
+        )
+
+        self._poly = None
+        self._prepared = None
+        self._support = None
 
     @staticmethod
     def __main__():
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots()
         ax.set_title("Polygon")
         polygon = Polygon([(6, 6), (6, 8), (8, 8), (8, 6)])
@@ -34,11 +93,25 @@ class Polygon(Obstacle):
     # Public Methods
     # -------------------------------------------------------------------------------- #
 
+    @property
+    def poly(self):
+        """
+        The cached shapely geometry of the polygon, built on first use
+        """
+        if self._poly is None:
+            import shapely.geometry as geo
+
+            self._poly = geo.Polygon(self.points)
+
+        return self._poly
+
     def plot(self, fig: Figure, ax: Axes) -> None:
         """
         Plots the polygon in the figure
         * ax: pyplot's axes (1 axis)
         """
+        import matplotlib.pyplot as plt
+
         ax.add_patch(
             plt.Polygon(  # type: ignore
                 self.points,
@@ -47,13 +120,167 @@ class Polygon(Obstacle):
             )
         )
 
-    def distance(self, point: tuple[float, float]) -> float:
+    def as_support(self):
         """
-        Calculates a point's distance to the polygon
+        Returns a cached support-function view of the polygon, usable from
+        numba-compiled planner loops
+        """
+        if self._support is None:
+            from rrt_methods.obstacles._nb import PolygonSF
+
+            self._support = PolygonSF(self._xs, self._ys)
+
+        return self._support
+
+    def contains(self, x: float, y: float) -> bool:
+        """
+        Checks whether a point lies inside the polygon using the prepared
+        shapely geometry, which caches the containment acceleration structure
         * x: x coordinate of the point
         * y: y coordinate of the point
         """
-        return self.poly.distance(geo.Point(point))
+        import shapely.geometry as geo
+
+        if self._prepared is None:
+            import shapely.prepared
+
+            self._prepared = shapely.prepared.prep(self.poly)
+
+        return self._prepared.contains(geo.Point(x, y))
+
+    def contains_batch(self, pts: np.ndarray) -> np.ndarray:
+        """
+        Checks which points of a batch lie inside the polygon using a
+        vectorized PNPOLY ray cast over the precomputed edge arrays
+        * pts: (N, 2) array of x and y coordinates
+        """
+        px = pts[:, 0][:, None]
+        py = pts[:, 1][:, None]
+
+        crossing = (self._ys > py) != (self._ys1 > py)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            hits = crossing & (
+                px
+                < (self._xs1 - self._xs) * (py - self._ys) / (self._ys1 - self._ys)
+                + self._xs
+            )
+
+        return np.bitwise_xor.reduce(hits, axis=1)
+
+    def is_free(self, x: float, y: float, margin: float = 0.0) -> bool:
+        """
+        Checks whether a point lies at least margin away from the polygon,
+        testing the inflated bounding box before the exact distance
+        * x: x coordinate of the point
+        * y: y coordinate of the point
+        * margin: minimum clearance for the point to be considered free
+        """
+        if (
+            x < self.minx - margin
+            or x > self.maxx + margin
+            or y < self.miny - margin
+            or y > self.maxy + margin
+        ):
+            return True
+
+        return self.distance(x, y) > margin
+
+    def intersects_segment(
+        self, p: tuple[float, float], q: tuple[float, float]
+    ) -> bool:
+        """
+        Checks whether the segment from p to q intersects the polygon, using a
+        bounding-box reject followed by vectorized orientation tests over the
+        precomputed edge arrays
+        * p: x and y coordinates of the segment's start
+        * q: x and y coordinates of the segment's end
+        """
+        px, py = p
+        qx, qy = q
+
+        # Broad phase: the segment's box must overlap the polygon's box
+        if (
+            max(px, qx) < self.minx
+            or min(px, qx) > self.maxx
+            or max(py, qy) < self.miny
+            or min(py, qy) > self.maxy
+        ):
+            return False
+
+        # The segment crosses an edge when the edge endpoints lie on opposite
+        # sides of the segment's line and vice versa
+        d1 = (qx - px) * (self._ys - py) - (qy - py) * (self._xs - px)
+        d2 = (qx - px) * (self._ys1 - py) - (qy - py) * (self._xs1 - px)
+        d3 = (self._xs1 - self._xs) * (py - self._ys) - (
+            self._ys1 - self._ys
+        ) * (px - self._xs)
+        d4 = (self._xs1 - self._xs) * (qy - self._ys) - (
+            self._ys1 - self._ys
+        ) * (qx - self._xs)
+
+        if (((d1 > 0) != (d2 > 0)) & ((d3 > 0) != (d4 > 0))).any():
+            return True
+
+        # No edge crossing: the segment intersects only if it lies inside
+        return bool(self.contains_batch(np.array([[px, py]]))[0])
+
+    def shapely_geometry(self):
+        """
+        Returns the cached shapely geometry representing the polygon
+        """
+        return self.poly
+
+    def distance_batch(self, pts: np.ndarray) -> np.ndarray:
+        """
+        Calculates the distances from a batch of points to the polygon with
+        broadcasted clamped projections onto every edge, staying in numpy
+        instead of constructing one GEOS point per query. Points inside the
+        polygon are at distance zero
+        * pts: (N, 2) array of x and y coordinates
+        """
+        px = pts[:, 0][:, None]
+        py = pts[:, 1][:, None]
+
+        edge_dx = self._xs1 - self._xs
+        edge_dy = self._ys1 - self._ys
+        length2 = np.maximum(edge_dx * edge_dx + edge_dy * edge_dy, 1e-300)
+
+        # Parameter of each point's projection onto each edge, clamped to
+        # the segment
+        t = ((px - self._xs) * edge_dx + (py - self._ys) * edge_dy) / length2
+        np.clip(t, 0.0, 1.0, out=t)
+
+        dx = px - (self._xs + t * edge_dx)
+        dy = py - (self._ys + t * edge_dy)
+        distance = np.sqrt(np.min(dx * dx + dy * dy, axis=1))
+
+        distance[self.contains_batch(pts)] = 0.0
+        return distance
+
+    def distance_many(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Calculates the distances from a batch of x and y coordinate arrays to
+        the polygon; see distance_batch
+        * xs: x coordinates of the query points
+        * ys: y coordinates of the query points
+        """
+        return self.distance_batch(np.column_stack([xs, ys]))
+
+    def distance(self, x: float, y: float) -> float:
+        """
+        Calculates a point's exact distance to the polygon
+        * x: x coordinate of the point
+        * y: y coordinate of the point
+        """
+        if self._simple is None:
+            self._simple = self.poly.is_valid
+
+        if self._simple:
+            return max(poly_sdf(self._xs, self._ys, x, y), 0.0)
+
+        import shapely.geometry as geo
+
+        return self.poly.distance(geo.Point(x, y))
 
 
 if __name__ == "__main__":
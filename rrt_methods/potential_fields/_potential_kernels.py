@@ -0,0 +1,57 @@
+# _potential_kernels.py
+# Author: Joao Lucas
+# Created: 29.08.2026
+
+from __future__ import annotations
+
+import math
+
+try:
+    from numba import njit
+
+except ImportError:
+    njit = None
+
+
+def _potential_scalar_py(x, y, attractors, cx, cy, r, margin, v_max, epsilon):
+    """
+    Pure-Python fallback used when numba is not installed
+    * x: x coordinate of the point
+    * y: y coordinate of the point
+    * attractors: (K, 3) array of attractor x, y and charge
+    * cx: x coordinates of the circle obstacles' centers
+    * cy: y coordinates of the circle obstacles' centers
+    * r: radii of the circle obstacles
+    * margin: obstacle margin size until the maximum potential
+    * v_max: maximum potential value
+    * epsilon: distance threshold for potential saturation
+    Returns the summed potential and whether it saturated at an obstacle
+    """
+    potential = 0.0
+
+    for i in range(cx.shape[0]):
+        distance = math.hypot(x - cx[i], y - cy[i]) - r[i]
+
+        if distance < epsilon:
+            return v_max, True
+
+        remaining = 1.0 - distance / margin
+        if remaining > 0.0:
+            potential += v_max * remaining
+
+    for k in range(attractors.shape[0]):
+        distance = math.hypot(x - attractors[k, 0], y - attractors[k, 1])
+
+        if distance < epsilon:
+            distance = epsilon
+
+        potential -= attractors[k, 2] / distance
+
+    return potential, False
+
+
+if njit is not None:
+    potential_scalar = njit(cache=True)(_potential_scalar_py)
+
+else:
+    potential_scalar = _potential_scalar_py
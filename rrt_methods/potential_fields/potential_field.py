@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import math
+
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.axes import Axes
@@ -11,6 +13,7 @@ from matplotlib.figure import Figure
 
 from rrt_methods.fields.field import Field
 from rrt_methods.obstacles.obstacle import Obstacle
+from rrt_methods.potential_fields._potential_kernels import potential_scalar
 
 
 class PotentialField(Field):
@@ -23,12 +26,18 @@ class PotentialField(Field):
         super().__init__(shape)
         self.margin = margin
 
-        # Attractors are an (x, y, q) tuple,
-        # representing position in space and charge
-        self.attractors: list[tuple[tuple[float, float], float]] = []
+        # Attractors are stored as a contiguous (K, 3) array of x, y and
+        # charge, so kernels and broadcasts read them without per-attractor
+        # tuple unpacking
+        self._A: np.ndarray = np.empty((0, 3))
         self.epsilon: float = 1e-3
         self.v_max: float = 10.0
 
+        # Lazily built lookup grid for potential_lookup, invalidated whenever
+        # an obstacle or attractor is added
+        self._cache_len: int = 256
+        self._pot_cache: np.ndarray | None = None
+
     @staticmethod
     def __main__():
         from rrt_methods.obstacles.circle import Circle
@@ -67,6 +76,7 @@ class PotentialField(Field):
         * obstacle: Obstacle to be added, should be an `Obstacle` object
         """
         super().add_obstacle(obstacle)
+        self._pot_cache = None
         return self
 
     def add_attractor(self, point: tuple[float, float], charge) -> PotentialField:
@@ -76,9 +86,18 @@ class PotentialField(Field):
         * point: (x, y) coordinates of the attractor
         * charge: The attractor's charge for calculating the potential
         """
-        self.attractors.append(((point[0], point[1]), charge))
+        self._A = np.vstack([self._A, [point[0], point[1], charge]])
+        self._pot_cache = None
         return self
 
+    @property
+    def attractors(self) -> list[tuple[tuple[float, float], float]]:
+        """
+        The attractors as ((x, y), charge) tuples, derived from the
+        contiguous storage array
+        """
+        return [((x, y), q) for x, y, q in self._A]
+
     def plot(self, fig: Figure, ax: Axes) -> None:
         """
         Plots the Potential Field
@@ -88,11 +107,10 @@ class PotentialField(Field):
 
         super().plot(fig, ax[1])
 
-        points = np.meshgrid(
-            np.linspace(0, self.shape[0], 100),
-            np.linspace(0, self.shape[1], 100)
-        )
-        potentials = np.vectorize(lambda x, y: self.potential((x, y)))(*points)
+        xs = np.linspace(0, self.shape[0], 100)
+        ys = np.linspace(0, self.shape[1], 100)
+        points = np.meshgrid(xs, ys)
+        potentials = self.potential_grid(xs, ys)
 
         c = ax[0].contourf(*points, potentials, levels=50, cmap="viridis")
         fig.colorbar(c, location="right", label="Potential")
@@ -109,39 +127,121 @@ class PotentialField(Field):
         * linspace_len: Number of points used to discretize the field when calculating
         the potential values
         """
-        points = np.meshgrid(
+        potentials = self.potential_grid(
             np.linspace(0, self.shape[0], linspace_len),
             np.linspace(0, self.shape[1], linspace_len),
         )
-        potentials = np.vectorize(lambda x, y: self.potential((x, y)))(*points)
 
         return (np.min(potentials), np.max(potentials))
 
+    def potential_grid(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Calculates the potential over a whole grid of points in a handful of
+        vectorized operations, instead of re-entering `potential` per cell.
+        Returns a (len(ys), len(xs)) array matching meshgrid(xs, ys) ordering
+        * xs: x coordinates of the grid's columns
+        * ys: y coordinates of the grid's rows
+        """
+        # Evaluate in row blocks so the temporary distance buffers stay small
+        # enough to live in cache regardless of the output resolution
+        block_len = 160
+        grid = np.empty((ys.shape[0], xs.shape[0]))
+
+        for start in range(0, ys.shape[0], block_len):
+            ys_block = ys[start : start + block_len]
+            grid_x, grid_y = np.meshgrid(xs, ys_block)
+            pts = np.column_stack([grid_x.ravel(), grid_y.ravel()])
+
+            potential = np.zeros(pts.shape[0])
+            saturated = np.zeros(pts.shape[0], dtype=bool)
+
+            for obstacle in self.obstacles:
+                distance = obstacle.distance_batch(pts)
+                saturated |= distance < self.epsilon
+                potential += self.v_max * np.maximum(
+                    1 - distance / self.margin, 0.0
+                )
+
+            if self._A.shape[0] > 0:
+                distance = np.hypot(
+                    pts[:, 0, None] - self._A[:, 0],
+                    pts[:, 1, None] - self._A[:, 1],
+                )
+                np.maximum(distance, self.epsilon, out=distance)
+                potential -= (self._A[:, 2] / distance).sum(axis=1)
+
+            # Points touching an obstacle saturate at the maximum potential,
+            # just like the scalar evaluation
+            potential[saturated] = self.v_max
+            grid[start : start + block_len] = potential.reshape(grid_x.shape)
+
+        return grid
+
+    def potential_lookup(self, x: float, y: float) -> float:
+        """
+        Returns the potential of the grid cell containing the point, from a
+        lazily built lookup grid. Repeated queries that land in the same cell
+        cost one array index instead of re-evaluating every obstacle and
+        attractor; use `potential` where the exact value matters
+        * x: x coordinate of the point
+        * y: y coordinate of the point
+        """
+        if self._pot_cache is None:
+            # Evaluate at the cell centers, so a lookup returns the potential
+            # of the nearest representative point of its cell
+            half_dx = self.shape[0] / self._cache_len / 2
+            half_dy = self.shape[1] / self._cache_len / 2
+            self._pot_cache = self.potential_grid(
+                np.linspace(half_dx, self.shape[0] - half_dx, self._cache_len),
+                np.linspace(half_dy, self.shape[1] - half_dy, self._cache_len),
+            )
+
+        i = min(int(y * self._cache_len / self.shape[1]), self._cache_len - 1)
+        j = min(int(x * self._cache_len / self.shape[0]), self._cache_len - 1)
+        return float(self._pot_cache[i, j])
+
     def potential(self, point: tuple[float, float]) -> float:
         """
         Calculates an estimate of the given point's potential. In the potential field,
         obstacles are positive charges, and attractors are negative ones.
         * point: (x, y) coordinates of the point
         """
-        potential: float = 0.0
+        x, y = point[0], point[1]
+
+        # Circle obstacles and attractors run in the compiled kernel
+        potential, saturated = potential_scalar(
+            x,
+            y,
+            self._A,
+            self._circle_cx,
+            self._circle_cy,
+            self._circle_r,
+            self.margin,
+            self.v_max,
+            self.epsilon,
+        )
 
-        for obstacle in self.obstacles:
-            distance = obstacle.distance(point)
+        if saturated:
+            return self.v_max
 
-            if distance < self.epsilon:
-                return self.v_max
+        # Remaining obstacle types keep their own scalar distance path. An
+        # obstacle whose bounding box is already margin away contributes
+        # nothing, so the box distance, a lower bound on the exact one,
+        # rejects it before the exact computation
+        for obstacle in self._other_obstacles:
+            minx, miny, maxx, maxy = obstacle.bbox
+            dx = max(minx - x, 0.0, x - maxx)
+            dy = max(miny - y, 0.0, y - maxy)
 
-            potential += self.v_max * np.max([1 - distance/self.margin, 0.0])
+            if math.hypot(dx, dy) >= self.margin:
+                continue
 
-        for attractor_point, charge in self.attractors:
-            distance = np.linalg.norm(
-                np.array(attractor_point) - np.array(point)
-            )
+            distance = obstacle.distance(x, y)
 
             if distance < self.epsilon:
-                distance = self.epsilon
+                return self.v_max
 
-            potential -= charge / distance
+            potential += self.v_max * max(1 - distance / self.margin, 0.0)
 
         return potential
 
@@ -12,6 +12,7 @@ from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 
 from rrt_methods.fields.field import Field
+from rrt_methods.geom.point import Point
 from rrt_methods.potential_fields.potential_field import PotentialField
 from rrt_methods.probability_fields.probability_field import ProbabilityField
 from rrt_methods.trees.tree import Tree
@@ -34,8 +35,14 @@ class PotentialRRT:
         self.goal_bias: float = 0.2
         self.delta: float = 0.1
         self.epsilon: float = 1e-1
+        self.batch: int = 32
         self.probability_field: ProbabilityField | None = None
 
+        # Buffer of pre-drawn samples, refilled in bulk so the fixed overhead
+        # of rvs is amortized over many iterations
+        self._sample_buf: np.ndarray = np.empty((0, 2))
+        self._sample_idx: int = 0
+
     @staticmethod
     def __main__():
         """Performs a test of the PotentialRRT class"""
@@ -57,7 +64,7 @@ class PotentialRRT:
         rrt.probability_field = ProbabilityField(rrt.potential_field)
         print(f"2D PDF Generated in {(datetime.now() - start).total_seconds()}s")
 
-        goal: tuple[float, float] = (9, 9)
+        goal = Point(9, 9)
         rrt.plan_path(goal)
         rrt.plot(fig, ax, goal)
         plt.show()
@@ -73,21 +80,58 @@ class PotentialRRT:
         """
         planning_start: datetime = datetime.now()
 
-        self.tree = Tree(self.tree.root.point)
+        self.tree = Tree(self.tree.root)
+
+        # Hoisted goal coordinates and squared threshold, so the per-iteration
+        # goal check is two multiplies and a compare
+        gx, gy = goal[0], goal[1]
+        eps2 = self.epsilon**2
 
         for _ in range(self.max_it):
-            # Sample the field until a point that is not inside an obstacle is found
+            # Process candidate samples a batch at a time: one nearest-node
+            # query, one vectorized extension and one batched collision pass
+            # cover the whole batch, and the first collision-free candidate
+            # extends the tree
             while True:
-                random_point = self._sample_free_space()
-                nearest_node = self.tree.find_nearest(random_point)
-                extended_point = nearest_node.extend(random_point, self.delta)
+                candidates = self._sample_free_batch(self.batch)
+                indices = self.tree.find_nearest_batch(candidates)
+                parents = self.tree.coords[indices]
+
+                towards = candidates - parents
+                lengths = np.hypot(towards[:, 0], towards[:, 1])
+                scale = np.minimum(self.delta / np.maximum(lengths, 1e-12), 1.0)
+                extensions = parents + towards * scale[:, None]
+
+                # Check eight samples along each parent-to-extension segment,
+                # all candidates in one batched call per obstacle, so the
+                # whole step is validated and not just its endpoint
+                ts = np.linspace(0.0, 1.0, 8)
+                segments = (
+                    parents[:, None, :]
+                    + ts[None, :, None] * (extensions - parents)[:, None, :]
+                ).reshape(-1, 2)
+
+                sample_free = np.ones(segments.shape[0], dtype=bool)
+                for obstacle in self.potential_field.obstacles:
+                    sample_free &= obstacle.distance_batch(segments) > 0
+
+                free = sample_free.reshape(extensions.shape[0], ts.shape[0]).all(
+                    axis=1
+                )
 
-                if self._check_collision_free(extended_point):
+                hits = np.nonzero(free)[0]
+                if hits.size > 0:
+                    first = hits[0]
+                    nearest = int(indices[first])
+                    extended_point = extensions[first]
                     break
 
-            nearest_node.add_child(extended_point)
+            self.tree.add_node(nearest, extended_point)
 
-            if np.linalg.norm(np.array(extended_point) - np.array(goal)) < self.epsilon:
+            dx = extended_point[0] - gx
+            dy = extended_point[1] - gy
+
+            if dx * dx + dy * dy < eps2:
                 print(
                     "Solution found in "
                     f"{(datetime.now() - planning_start).total_seconds()} seconds"
@@ -121,20 +165,63 @@ class PotentialRRT:
         Checks if the selected point collides with one of the obstacles in the field
         * point: (x, y) coordinates of the point
         """
-        for obstacle in self.potential_field.obstacles:
-            if obstacle.distance(point) == 0:
+        # Broad phase: only obstacles whose bounding box contains the point
+        # can collide with it
+        for obstacle in self.potential_field.obstacles_near(point[0], point[1]):
+            if not obstacle.is_free(point[0], point[1]):
                 return False
 
         return True
 
     def _sample_free_space(self) -> tuple[float, float]:
-        """Samples the probability field for a random point in the field"""
-        if self.probability_field:
-            return self.probability_field.rvs(num_points=1)[0]
+        """
+        Pops the next point from the pre-drawn sample buffer, refilling it
+        from the probability field in bulk when exhausted
+        """
+        return self._sample_free_batch(1)[0]
 
-        else:
+    def _sample_free_batch(self, count: int) -> np.ndarray:
+        """
+        Pops the next count points from the pre-drawn sample buffer, refilling
+        it from the probability field in bulk as needed
+        * count: number of points to return
+        """
+        if not self.probability_field:
             raise Exception("Probability field undefined!")
 
+        out = np.empty((count, 2))
+        filled = 0
+
+        while filled < count:
+            if self._sample_idx >= self._sample_buf.shape[0]:
+                self._refill_samples()
+                continue
+
+            take = min(
+                count - filled, self._sample_buf.shape[0] - self._sample_idx
+            )
+            out[filled : filled + take] = self._sample_buf[
+                self._sample_idx : self._sample_idx + take
+            ]
+            self._sample_idx += take
+            filled += take
+
+        return out
+
+    def _refill_samples(self) -> None:
+        """
+        Refills the sample buffer and drops the colliding samples for the
+        whole buffer in one vectorized pass per obstacle
+        """
+        buffer = self.probability_field.rvs(num_points=4096)
+        free = np.ones(buffer.shape[0], dtype=bool)
+
+        for obstacle in self.potential_field.obstacles:
+            free &= obstacle.distance_batch(buffer) > 0
+
+        self._sample_buf = buffer[free]
+        self._sample_idx = 0
+
 
 if __name__ == "__main__":
     PotentialRRT.__main__()
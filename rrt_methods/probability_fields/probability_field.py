@@ -4,9 +4,9 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy.integrate import simpson
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
-from scipy.integrate import dblquad
 
 from rrt_methods.potential_fields.potential_field import PotentialField
 
@@ -18,19 +18,32 @@ class ProbabilityField:
         for a given Potential Field and allows sampling it for points
         * field: The PotentialField that will be used for generating the PDF
         """
-        # Store the field as well as its maximum and minimum potential values
+        # Evaluate the potential once over a grid; the same evaluation yields
+        # the potential range, the PDF normalization and the sampling CDF
         self.field: PotentialField = field
-        self.pot_min, self.pot_max = self.field.compute_potential_range(
-            linspace_len=100
+        grid_len = 200
+        self._grid_xs = np.linspace(0.0, self.field.shape[0], grid_len)
+        self._grid_ys = np.linspace(0.0, self.field.shape[1], grid_len)
+        self._cell_dx = self._grid_xs[1] - self._grid_xs[0]
+        self._cell_dy = self._grid_ys[1] - self._grid_ys[0]
+
+        grid = self.field.potential_grid(self._grid_xs, self._grid_ys)
+        self.pot_min: float = float(grid.min())
+        self.pot_max: float = float(grid.max())
+
+        # Simpson-rule normalization factor for the PDF over the tabulated
+        # grid: quadrature accuracy without the old adaptive integrator's
+        # thousands of scalar potential callbacks
+        weights = self.pot_max - grid
+        self.normalization_factor: float = float(
+            simpson(simpson(weights, x=self._grid_xs, axis=1), x=self._grid_ys)
         )
 
-        # Compute the normalization factor for the PDF
-        self.normalization_factor, _ = dblquad(  # type: ignore
-            lambda x, y: self.pot_max - self.field.potential((x, y)),
-            0.0, self.field.shape[0],
-            0.0, self.field.shape[1],
-            epsrel=1e-2,
-        )
+        # Cumulative sum of the discretized PDF, so that rvs draws every
+        # sample with one vectorized searchsorted instead of
+        # rejection-sampling in Python
+        self._cdf = np.cumsum(weights.ravel())
+        self._cdf /= self._cdf[-1]
 
     @staticmethod
     def __main__():
@@ -70,25 +83,31 @@ class ProbabilityField:
     # -------------------------------------------------------------------------------- #
     def rvs(self, num_points=1, seed=None) -> list[tuple[float, float]]:
         """
-        Returns a sample drawn from the 2D Probability Density Function
+        Returns a sample drawn from the 2D Probability Density Function by
+        inverting the precomputed discrete CDF
         * num_points: Number of points that will be sampled from the field
         * seed: Seed of the random number generator
         """
         rng = np.random.default_rng(seed)
 
-        samples = []
-        for _ in range(num_points):
-            while True:
-                # Sample uniformly in the bounding box
-                x = rng.uniform(0, self.field.shape[0])
-                y = rng.uniform(0, self.field.shape[1])
+        # Map uniform draws through the CDF to grid cells, then jitter the
+        # samples uniformly inside their cell
+        cells = np.searchsorted(self._cdf, rng.uniform(size=num_points))
+        rows, cols = np.divmod(cells, self._grid_xs.shape[0])
 
-                # Accept/reject based on PDF value
-                if rng.uniform(0, 1) < self._pdf(x, y):
-                    samples.append((x, y))
-                    break
+        xs = self._grid_xs[cols] + rng.uniform(
+            -self._cell_dx / 2, self._cell_dx / 2, size=num_points
+        )
+        ys = self._grid_ys[rows] + rng.uniform(
+            -self._cell_dy / 2, self._cell_dy / 2, size=num_points
+        )
 
-        return np.array(samples)  # type: ignore
+        return np.column_stack(
+            [
+                np.clip(xs, 0.0, self.field.shape[0]),
+                np.clip(ys, 0.0, self.field.shape[1]),
+            ]
+        )  # type: ignore
 
     def plot(self, fig: Figure, ax: Axes) -> None:
         """
@@ -96,11 +115,10 @@ class ProbabilityField:
         fig: matplotlib Figure object
         ax: matplotlib Axes object (1 axis)
         """
-        points = np.meshgrid(
-            np.linspace(0, self.field.shape[0], 100),
-            np.linspace(0, self.field.shape[1], 100),
-        )
-        probabilities = np.vectorize(lambda x, y: self._pdf(x, y))(*points)
+        xs = np.linspace(0, self.field.shape[0], 100)
+        ys = np.linspace(0, self.field.shape[1], 100)
+        points = np.meshgrid(xs, ys)
+        probabilities = self._pdf_grid(xs, ys)
 
         x, y = points
         contour = ax.contourf(x, y, probabilities, levels=50, cmap="inferno", zorder=0)
@@ -115,6 +133,17 @@ class ProbabilityField:
     # -------------------------------------------------------------------------------- #
     # Private Methods
     # -------------------------------------------------------------------------------- #
+    def _pdf_grid(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Calculates the Probability Density Function over a whole grid using
+        the vectorized potential evaluation, avoiding one Python call per cell
+        * xs: x coordinates of the grid's columns
+        * ys: y coordinates of the grid's rows
+        """
+        return (
+            self.pot_max - self.field.potential_grid(xs, ys)
+        ) / self.normalization_factor
+
     def _pdf(self, x: float, y: float) -> float:
         """
         Calculate the probability of choosing the point defined by the given coordinates
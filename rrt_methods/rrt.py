@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import math
+import os
 import random
 
 import matplotlib.pyplot as plt
@@ -11,7 +13,12 @@ import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 
+from rrt_methods._rrt_jit import plan as plan_jit
+from rrt_methods._rrt_jit import plan_multi
 from rrt_methods.fields.field import Field
+from rrt_methods.geom.point import Point
+from rrt_methods.obstacles.circle import Circle
+from rrt_methods.obstacles.polygon import Polygon
 from rrt_methods.trees.tree import Tree
 
 
@@ -33,6 +40,23 @@ class RRT:
         self.delta = 0.1
         self.eps = 1e-3
 
+        # Goal-rooted tree and bridge indices set by plan_path_bidirectional
+        self.tree_b: Tree | None = None
+        self._bridge: tuple[int, int] | None = None
+
+        # Cached generator and field shape, so sampling does not rebuild the
+        # shape array or re-seed a generator on every iteration
+        self._rng = np.random.default_rng()
+        self._shape = np.asarray(self.field.shape, dtype=np.float64)
+        self._free_mask: np.ndarray | None = None
+
+        # Leftover collision-free samples from the last batched draw, so the
+        # RNG and filtering cost is amortized over many iterations; the draw
+        # buffer is preallocated and refilled in place
+        self._draw_buf: np.ndarray = np.empty((128, 2))
+        self._sample_buf: np.ndarray = np.empty((0, 2))
+        self._sample_idx: int = 0
+
     @staticmethod
     def __main__():
         """Performs a test of the RRT class"""
@@ -47,7 +71,7 @@ class RRT:
             .add_obstacle(Polygon([(6, 6), (6, 8), (8, 8), (8, 6)])),
         )
 
-        goal_position: tuple[float, float] = (9, 9)
+        goal_position = Point(9, 9)
         rrt.plan_path(goal_position)
         rrt.plot(fig, ax, goal_position)
         ax.autoscale_view()
@@ -63,7 +87,21 @@ class RRT:
         the Potential RRT method
         * goal: (x, y) coordinates of the point
         """
-        self.tree = Tree(self.tree.root.point)
+        self.tree = Tree(self.tree.root)
+
+        # The whole loop runs compiled when numba is installed and every
+        # obstacle packs into the kernel's array layout
+        if plan_jit is not None and self._plan_path_jit(goal):
+            return
+
+        # Collision checks run against the rasterized free-space mask for the
+        # whole plan; the 0.1 m extension step dwarfs the cell size
+        self._free_mask = self.field.build_free_mask()
+
+        # Hoisted goal coordinates and squared threshold, so the per-iteration
+        # goal check is two multiplies and a compare
+        gx, gy = goal[0], goal[1]
+        eps2 = self.eps**2
 
         for _ in range(self.max_it):
             if random.random() < self.goal_bias:
@@ -72,17 +110,173 @@ class RRT:
             else:
                 random_point = self._sample_free_space()
 
-            nearest_node = self.tree.find_nearest(random_point)
-            extended_point = nearest_node.extend(random_point, self.delta)
+            nearest = self.tree.find_nearest(random_point)
+            extended_point = self.tree.extend(nearest, random_point, self.delta)
 
             if not self._check_collision_free(extended_point):
                 continue
 
-            nearest_node.add_child(extended_point)
+            # The whole extension segment must be free, not just its endpoint
+            parent = self.tree.coords[nearest]
+            if not self._check_segment_free(
+                (float(parent[0]), float(parent[1])), extended_point
+            ):
+                continue
+
+            self.tree.add_node(nearest, extended_point)
+
+            dx = extended_point[0] - gx
+            dy = extended_point[1] - gy
+
+            if dx * dx + dy * dy < eps2:
+                break
+
+    def plan_path_parallel(
+        self, goal: tuple[float, float], instances: int | None = None
+    ) -> bool:
+        """
+        Plans by racing several independent RRT instances with different
+        seeds and keeping the first that reaches the goal — OR-parallelism
+        over the compiled planning kernel, run on all cores when numba is
+        installed and sequentially otherwise. Returns whether any instance
+        reached the goal; the winning tree replaces self.tree either way
+        * goal: (x, y) coordinates of the goal
+        * instances: number of independent instances; defaults to the CPU count
+        """
+        packed = self._pack_obstacles()
+
+        if packed is None:
+            raise Exception("Obstacle types not supported by the packed planner!")
+
+        if instances is None:
+            instances = os.cpu_count() or 4
+
+        circles, poly_verts, poly_counts = packed
+        root = self.tree.root
+        seeds = self._rng.integers(2**31, size=instances)
+
+        all_coords, all_parents, counts = plan_multi(
+            root[0],
+            root[1],
+            float(goal[0]),
+            float(goal[1]),
+            circles,
+            poly_verts,
+            poly_counts,
+            float(self.field.shape[0]),
+            float(self.field.shape[1]),
+            self.max_it,
+            self.delta,
+            self.goal_bias,
+            self.eps,
+            seeds,
+        )
+
+        # First instance whose last node is within eps of the goal wins; if
+        # none connected, keep the most developed tree
+        eps2 = self.eps**2
+        winner = None
+
+        for k in range(instances):
+            last = all_coords[k, counts[k] - 1]
+            dx = last[0] - goal[0]
+            dy = last[1] - goal[1]
 
-            if np.linalg.norm(np.array(extended_point) - np.array(goal)) < self.eps:
+            if dx * dx + dy * dy < eps2:
+                winner = k
                 break
 
+        success = winner is not None
+
+        if winner is None:
+            winner = int(np.argmax(counts))
+
+        self.tree = Tree.from_arrays(
+            all_coords[winner], all_parents[winner], int(counts[winner])
+        )
+        return success
+
+    def plan_path_bidirectional(self, goal: tuple[float, float]) -> bool:
+        """
+        Attempts to plan a path with the RRT-Connect strategy: one tree grows
+        from the source and one from the goal, alternating roles each
+        iteration, and after every successful extension the other tree
+        greedily extends toward the new node until blocked or connected. Each
+        tree only has to cover about half the space, so hard problems
+        converge in far fewer iterations than the single-tree planner.
+        Returns whether the trees met; connected_path() gives the result
+        * goal: (x, y) coordinates of the goal
+        """
+        self.tree = Tree(self.tree.root)
+        self.tree_b = Tree((goal[0], goal[1]))
+        self._bridge = None
+        self._free_mask = self.field.build_free_mask()
+
+        delta2 = self.delta**2
+        active, passive = self.tree, self.tree_b
+
+        for _ in range(self.max_it):
+            random_point = self._sample_free_space()
+            nearest = active.find_nearest(random_point)
+            new_point = active.extend(nearest, random_point, self.delta)
+
+            anchor = active.coords[nearest]
+
+            if self._check_collision_free(new_point) and self._check_segment_free(
+                (float(anchor[0]), float(anchor[1])), new_point
+            ):
+                new_index = active.add_node(nearest, new_point)
+
+                # Greedy connect: walk the passive tree toward the new node
+                # until an extension collides or the trees meet
+                near = passive.find_nearest(new_point)
+
+                while True:
+                    step = passive.extend(near, new_point, self.delta)
+                    near_point = passive.coords[near]
+
+                    if not self._check_collision_free(step) or not (
+                        self._check_segment_free(
+                            (float(near_point[0]), float(near_point[1])), step
+                        )
+                    ):
+                        break
+
+                    near = passive.add_node(near, step)
+                    dx = step[0] - new_point[0]
+                    dy = step[1] - new_point[1]
+
+                    # The bridge segment between the trees is part of the
+                    # final path, so it needs the same collision check as
+                    # every other edge before the trees are declared connected
+                    if dx * dx + dy * dy < delta2 and self._check_segment_free(
+                        step, new_point
+                    ):
+                        if active is self.tree:
+                            self._bridge = (new_index, near)
+
+                        else:
+                            self._bridge = (near, new_index)
+
+                        return True
+
+            active, passive = passive, active
+
+        print("Maximum search iterations reached!")
+        return False
+
+    def connected_path(self) -> np.ndarray:
+        """
+        Returns the (N, 2) source-to-goal path found by the bidirectional
+        planner, joining the two trees at the bridge nodes
+        """
+        if self.tree_b is None or self._bridge is None:
+            raise Exception("No bidirectional path planned!")
+
+        source_half = self.tree.path_to_root(self._bridge[0])[::-1]
+        goal_half = self.tree_b.path_to_root(self._bridge[1])
+        return np.vstack([source_half, goal_half])
+
     def plot(self, fig: Figure, ax: Axes, goal_position: tuple[float, float] | None = None) -> None:
         """
         Plots the field and the RRT
@@ -91,28 +285,157 @@ class RRT:
         self.field.plot(fig, ax)
         self.tree.plot(fig, ax, goal_position)
 
+        if self.tree_b is not None:
+            self.tree_b.plot(fig, ax)
+
+            if self._bridge is not None:
+                path = self.connected_path()
+                ax.plot(path[:, 0], path[:, 1], color="tab:blue", zorder=2)
+
     # -------------------------------------------------------------------------------- #
     # Private Methods
     # -------------------------------------------------------------------------------- #
+    def _pack_obstacles(
+        self,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """
+        Packs the field's obstacles into the compiled kernels' array layout:
+        (Nc, 3) circles plus padded (Np, Mv, 2) polygon vertices with their
+        counts. Returns None when an obstacle type does not fit
+        """
+        polygons = []
+
+        for obstacle in self.field.obstacles:
+            if isinstance(obstacle, Polygon):
+                polygons.append(np.column_stack([obstacle._xs, obstacle._ys]))
+
+            elif not isinstance(obstacle, Circle):
+                return None
+
+        circles = np.column_stack(
+            [
+                self.field._circle_cx,
+                self.field._circle_cy,
+                self.field._circle_r,
+            ]
+        )
+
+        max_verts = max((p.shape[0] for p in polygons), default=0)
+        poly_verts = np.zeros((len(polygons), max_verts, 2))
+        poly_counts = np.empty(len(polygons), dtype=np.int64)
+
+        for i, verts in enumerate(polygons):
+            poly_verts[i, : verts.shape[0]] = verts
+            poly_counts[i] = verts.shape[0]
+
+        return circles, poly_verts, poly_counts
+
+    def _plan_path_jit(self, goal: tuple[float, float]) -> bool:
+        """
+        Runs the planning loop in the compiled kernel, packing the obstacles
+        into plain arrays first. Returns False when an obstacle type does not
+        fit the packed layout, leaving the Python loop to handle it
+        * goal: (x, y) coordinates of the goal
+        """
+        packed = self._pack_obstacles()
+
+        if packed is None:
+            return False
+
+        circles, poly_verts, poly_counts = packed
+        root = self.tree.root
+        coords, parents, n = plan_jit(
+            root[0],
+            root[1],
+            float(goal[0]),
+            float(goal[1]),
+            circles,
+            poly_verts,
+            poly_counts,
+            float(self.field.shape[0]),
+            float(self.field.shape[1]),
+            self.max_it,
+            self.delta,
+            self.goal_bias,
+            self.eps,
+            int(self._rng.integers(2**31)),
+        )
+
+        self.tree = Tree.from_arrays(coords, parents, n)
+        return True
+
     def _check_collision_free(self, point: tuple[float, float]):
         """
         Checks if the selected point collides with one of the obstacles in the field
         * point: (x, y) coordinates of the point
         """
-        for obstacle in self.field.obstacles:
-            if obstacle.distance(point) == 0:
+        if self._free_mask is not None:
+            resolution = self._free_mask.shape[0]
+            i = min(int(point[1] * resolution / self.field.shape[1]), resolution - 1)
+            j = min(int(point[0] * resolution / self.field.shape[0]), resolution - 1)
+            return bool(self._free_mask[i, j])
+
+        # Broad phase: only obstacles whose bounding box contains the point
+        # can collide with it
+        for obstacle in self.field.obstacles_near(point[0], point[1]):
+            if not obstacle.is_free(point[0], point[1]):
+                return False
+
+        return True
+
+    def _check_segment_free(
+        self, p: tuple[float, float], q: tuple[float, float]
+    ) -> bool:
+        """
+        Checks if the segment from p to q crosses any obstacle, consulting
+        only the obstacles whose bounding box is near the segment
+        * p: x and y coordinates of the segment's start
+        * q: x and y coordinates of the segment's end
+        """
+        mid_x = (p[0] + q[0]) / 2
+        mid_y = (p[1] + q[1]) / 2
+        radius = math.hypot(q[0] - p[0], q[1] - p[1]) / 2
+
+        for obstacle in self.field.obstacles_near(mid_x, mid_y, radius):
+            if obstacle.intersects_segment(p, q):
                 return False
 
         return True
 
     def _sample_free_space(self) -> tuple[float, float]:
         """
-        Randomly samples the field until a point that is not inside an obstacle is found
+        Pops the next collision-free sample from the buffered batch, drawing
+        and filtering a new 128-sample batch in one vectorized pass when the
+        buffer runs out
         """
-        while True:
-            random_point = (np.random.random(2) * np.array(self.field.shape)).tolist()
-            if self._check_collision_free(random_point):
-                return random_point
+        while self._sample_idx >= self._sample_buf.shape[0]:
+            batch = self._draw_buf
+            self._rng.random(out=batch)
+            np.multiply(batch, self._shape, out=batch)
+
+            if self._free_mask is not None:
+                resolution = self._free_mask.shape[0]
+                rows = np.minimum(
+                    (batch[:, 1] * resolution / self._shape[1]).astype(np.intp),
+                    resolution - 1,
+                )
+                cols = np.minimum(
+                    (batch[:, 0] * resolution / self._shape[0]).astype(np.intp),
+                    resolution - 1,
+                )
+                free = self._free_mask[rows, cols]
+
+            else:
+                free = np.ones(batch.shape[0], dtype=bool)
+                for obstacle in self.field.obstacles:
+                    free &= obstacle.distance_batch(batch) > 0
+
+            self._sample_buf = batch[free]
+            self._sample_idx = 0
+
+        sample = self._sample_buf[self._sample_idx]
+        self._sample_idx += 1
+        return sample
 
 
 if __name__ == "__main__":
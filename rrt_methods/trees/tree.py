@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import math
+
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.figure import Figure
@@ -13,179 +15,253 @@ from matplotlib.axes import Axes
 class Tree:
     def __init__(self, point: tuple[float, float]) -> None:
         """
-        Class that represents a tree data structure
+        Class that represents a tree data structure. Nodes live in contiguous
+        arrays — a (N, 2) float coordinate array and a (N,) int parent-index
+        array — so nearest-neighbor scans and traversals run over dense
+        memory instead of chasing node objects. Coordinates are float32:
+        planner precision is bounded by the extension step, orders of
+        magnitude above float32 resolution at field scale, and the narrower
+        rows halve the memory the nearest scans pull through cache. The root
+        sits at index 0 with parent index -1
         * point: x and y coordinates of the tree's root node
         """
-        self.root = TreeNode(point, None)
+        self._coords: np.ndarray = np.empty((16, 2), dtype=np.float32)
+        self._parents: np.ndarray = np.empty(16, dtype=np.int32)
+        self.n: int = 0
+
+        # KD-tree over the registered prefix, rebuilt lazily once the tree
+        # doubles past the last build
+        self._kdtree = None
+        self._kd_size: int = 0
+
+        self._coords[0] = point
+        self._parents[0] = -1
+        self.n = 1
+
+    @classmethod
+    def from_arrays(cls, coords: np.ndarray, parents: np.ndarray, n: int) -> Tree:
+        """
+        Builds a tree directly from coordinate and parent-index arrays, as
+        produced by the compiled planning loop
+        * coords: (N, 2) array of node coordinates; row 0 is the root
+        * parents: (N,) array of parent indices; the root's is -1
+        * n: number of valid nodes in the arrays
+        """
+        tree = cls((float(coords[0, 0]), float(coords[0, 1])))
+        tree._coords = np.array(coords[:n], dtype=np.float32)
+        tree._parents = np.array(parents[:n], dtype=np.int32)
+        tree.n = n
+        return tree
 
     @staticmethod
     def __main__():
         """Performs a test of the Tree class"""
         sample_tree = Tree((0.0, 0.0))
-        sample_tree.root.add_child(sample_tree.root.extend((3.0, 3.0), 2.0))
-        sample_tree.root.add_child(sample_tree.root.extend((-1.0, 1.0), 2.0))
-        sample_tree.root.add_child(sample_tree.root.extend((1.0, -1.0), 2.0))
-        sample_tree.root.add_child(sample_tree.root.extend((-1.0, -1.0), 2.0))
+        for target in ((3.0, 3.0), (-1.0, 1.0), (1.0, -1.0), (-1.0, -1.0)):
+            sample_tree.add_node(0, sample_tree.extend(0, target, 2.0))
 
-        sample_tree.root.children[0].add_child(
-            sample_tree.root.children[0].extend((2.0, 2.0), 2.0)
-        )
+        sample_tree.add_node(1, sample_tree.extend(1, (2.0, 2.0), 2.0))
 
         sample_tree.print()
 
         fig, ax = plt.subplots()
         sample_tree.plot(fig, ax)
+        ax.autoscale_view()
         plt.show()
 
     # -------------------------------------------------------------------------------- #
     # Public Methods
     # -------------------------------------------------------------------------------- #
-    def find_nearest(self, point: tuple[float, float]) -> TreeNode:
+    @property
+    def root(self) -> tuple[float, float]:
         """
-        Find the nearest tree node to the point
-        * point: x and y coordinates of the point
+        The x and y coordinates of the tree's root node
         """
-        return self._find_nearest_recursion(self.root, point)
+        return (float(self._coords[0, 0]), float(self._coords[0, 1]))
 
-    def print(self):
+    @property
+    def coords(self) -> np.ndarray:
         """
-        Prints a representation of the tree
+        The node coordinates as a read-only (n, 2) view
         """
-        self._print_recursion(self.root)
+        return self._coords[: self.n]
 
-    def plot(self, fig: Figure, ax: Axes, node_position: tuple[float, float] | None = None):
+    @property
+    def parents(self) -> np.ndarray:
         """
-        Creates a plot representing the tree
-        * ax: matplotlib Axes object (1 axis)
-        * node_position: The position of a node, for printing from it until the root
+        The node parent indices as a read-only (n,) view; the root's is -1
         """
-        self._plot_complete_recursion(self.root, ax)
+        return self._parents[: self.n]
 
-        if node_position:
-            node = self.find_nearest(node_position)
-            self._plot_from_child(node, ax)
+    def add_node(self, parent_index: int, point: tuple[float, float]) -> int:
+        """
+        Appends a node as a child of the node at parent_index, doubling the
+        arrays' capacity when full, and returns the new node's index
+        * parent_index: index of the new node's parent
+        * point: x and y coordinates of the new node
+        """
+        if self.n == self._coords.shape[0]:
+            capacity = 2 * self._coords.shape[0]
+            grown_coords = np.empty((capacity, 2), dtype=np.float32)
+            grown_coords[: self.n] = self._coords
+            self._coords = grown_coords
+
+            grown_parents = np.empty(capacity, dtype=np.int32)
+            grown_parents[: self.n] = self._parents
+            self._parents = grown_parents
+
+        self._coords[self.n] = point
+        self._parents[self.n] = parent_index
+        self.n += 1
+        return self.n - 1
+
+    def extend(
+        self, index: int, point: tuple[float, float], delta: float
+    ) -> tuple[float, float]:
+        """
+        Extends the node at the given index towards a point, returning the
+        extension clipped to at most delta away from the node
+        * index: index of the node to extend from
+        * point: x and y coordinates of the given point
+        * delta: maximum distance between the node and the extension
+        """
+        x, y = self._coords[index]
+        dx = point[0] - x
+        dy = point[1] - y
+        distance = math.hypot(dx, dy)
 
-        ax.autoscale_view()
+        if distance < delta:
+            return (point[0], point[1])
 
-    # -------------------------------------------------------------------------------- #
-    # Private Methods
-    # -------------------------------------------------------------------------------- #
-    def _find_nearest_recursion(
-        self, node: TreeNode, point: tuple[float, float]
-    ) -> TreeNode:
+        scale = delta / distance
+        return (x + dx * scale, y + dy * scale)
+
+    def find_nearest(self, point: tuple[float, float]) -> int:
         """
-        Recursive call to find the nearest tree node to the point
-        * node: current recursive call's node
+        Finds the index of the nearest tree node to the point, combining a
+        KD-tree query over the indexed prefix with a vectorized scan of the
+        nodes added since the last rebuild
         * point: x and y coordinates of the point
         """
-        nearest = node
-        nearest_distance: float = float(
-            np.linalg.norm(np.array(point) - np.array(nearest.point))
-        )
+        self._maybe_rebuild()
 
-        for child in node.children:
-            child_nearest = self._find_nearest_recursion(child, point)
-            child_nearest_distance: float = float(
-                np.linalg.norm(np.array(point) - np.array(child_nearest.point))
-            )
+        best_index = -1
+        best_distance = np.inf
 
-            if child_nearest_distance < nearest_distance:
-                nearest = child_nearest
-                nearest_distance = child_nearest_distance
+        if self._kdtree is not None:
+            best_distance, best_index = self._kdtree.query(point)
 
-        return nearest
+        if self.n > self._kd_size:
+            tail = self._coords[self._kd_size : self.n]
+            tail_d2 = (tail[:, 0] - point[0]) ** 2 + (tail[:, 1] - point[1]) ** 2
+            tail_index = int(np.argmin(tail_d2))
 
-    def _print_recursion(self, node: TreeNode, depth: int = 0):
-        """
-        Recursive call to print the nodes of a tree
-        * node: current recursive call's node
-        * depth: current recursive call's depth
-        """
-        print("  " * depth, f"Node ({node.point[0]:.4f}, {node.point[1]:.4f})")
+            if tail_d2[tail_index] < best_distance * best_distance:
+                best_index = self._kd_size + tail_index
 
-        for child in node.children:
-            self._print_recursion(child, depth + 1)
+        return int(best_index)
 
-    def _plot_complete_recursion(self, node: TreeNode, ax: Axes):
+    def find_nearest_batch(self, points: np.ndarray) -> np.ndarray:
         """
-        Recursive call to plot the nodes of a tree
-        * node: current recursive call's node
-        * ax: matplotlib Axes object (1 axis)
+        Finds the indices of the nearest tree nodes for a whole batch of
+        points in one KD-tree query plus one broadcasted scan of the
+        unindexed tail
+        * points: (K, 2) array of x and y coordinates
         """
-        # Plot this node
-        # plt.plot(node.point[0], node.point[1], "o", color="blue", zorder=1)
+        pts = np.asarray(points, dtype=np.float64)
+        self._maybe_rebuild()
 
-        # Plot a line back to the node's parent
-        if node.parent:
-            ax.plot(
-                [node.point[0], node.parent.point[0]],
-                [node.point[1], node.parent.point[1]],
-                color="tab:orange",
-                zorder=1,
-            )
+        best_distance = np.full(pts.shape[0], np.inf)
+        best_index = np.full(pts.shape[0], -1, dtype=np.intp)
+
+        if self._kdtree is not None:
+            best_distance, best_index = self._kdtree.query(pts)
+
+        if self.n > self._kd_size:
+            tail = self._coords[self._kd_size : self.n]
+            tail_d2 = (pts[:, 0, None] - tail[:, 0]) ** 2 + (
+                pts[:, 1, None] - tail[:, 1]
+            ) ** 2
+            tail_index = np.argmin(tail_d2, axis=1)
+            tail_best = tail_d2[np.arange(pts.shape[0]), tail_index]
+
+            better = tail_best < best_distance * best_distance
+            best_index[better] = self._kd_size + tail_index[better]
 
-        # Continue calling for all children
-        for child in node.children:
-            self._plot_complete_recursion(child, ax)
+        return best_index
 
-    def _plot_from_child(self, node: TreeNode, ax: Axes):
+    def path_to_root(self, index: int) -> np.ndarray:
         """
-        Recursive call to plot from a given child until the root of the node.
-        * node: current recursive call's node
-        * ax: matplotlib Axes object (1 axis)
+        Returns the coordinates of the nodes from the given index back to the
+        root, walking the parent-index array
+        * index: index of the path's starting node
         """
-        # Plot a line back to the node's parent
-        if node.parent:
-            ax.plot(
-                [node.point[0], node.parent.point[0]],
-                [node.point[1], node.parent.point[1]],
-                color="tab:blue",
-                zorder=2,
-            )
+        indices = []
 
-        # Call for parent
-        if node.parent:
-            self._plot_from_child(node.parent, ax)
+        while index != -1:
+            indices.append(index)
+            index = int(self._parents[index])
 
+        return self._coords[indices]
 
-class TreeNode:
-    def __init__(self, point: tuple[float, float], parent: TreeNode | None) -> None:
+    def print(self):
         """
-        Class that represents a node of a tree used in RRT.
-        * point: x and y coordinates of the current node
-        * parent: Current node's parent
+        Prints a representation of the tree
         """
+        # Depth-first over an explicit stack, visiting children in insertion
+        # order from a children adjacency built off the parent array
+        children: list[list[int]] = [[] for _ in range(self.n)]
+        for index in range(1, self.n):
+            children[self._parents[index]].append(index)
 
-        self.point: tuple[float, float] = point
-        self.parent: TreeNode | None = parent
-        self.children: list[TreeNode] = []
+        stack: list[tuple[int, int]] = [(0, 0)]
 
-    def add_child(self, point: tuple[float, float]):
+        while stack:
+            index, depth = stack.pop()
+            x, y = self._coords[index]
+            print("  " * depth, f"Node ({x:.4f}, {y:.4f})")
+
+            for child in reversed(children[index]):
+                stack.append((child, depth + 1))
+
+    def plot(self, fig: Figure, ax: Axes, node_position: tuple[float, float] | None = None):
         """
-        Method that creates a new node
-        and adds it as a child of the current node
-        * point: x and y coordinates of the new node
+        Creates a plot representing the tree
+        * ax: matplotlib Axes object (1 axis)
+        * node_position: The position of a node, for printing from it until the root
         """
-        new_node: TreeNode = TreeNode(point, self)
-        self.children.append(new_node)
+        from matplotlib.collections import LineCollection
+
+        # One artist for all parent-child edges, instead of one Line2D per
+        # edge
+        if self.n > 1:
+            coords = self._coords[: self.n]
+            segments = np.stack(
+                [coords[1:], coords[self._parents[1 : self.n]]], axis=1
+            )
+            ax.add_collection(
+                LineCollection(segments, colors="tab:orange", zorder=1)
+            )
+
+        if node_position:
+            path = self.path_to_root(self.find_nearest(node_position))
+            ax.plot(path[:, 0], path[:, 1], color="tab:blue", zorder=2)
 
-    def extend(self, point: tuple[float, float], delta: float) -> tuple[float, float]:
+    # -------------------------------------------------------------------------------- #
+    # Private Methods
+    # -------------------------------------------------------------------------------- #
+    def _maybe_rebuild(self) -> None:
         """
-        Method for implementing the RRT that extends
-        the current node towards a given point, returning the extension
-        * point: x and y coordinates of the given point
-        * delta: Maximum distance between the current node and the extension
+        Rebuilds the KD-tree once the unindexed tail exceeds sqrt(n) nodes,
+        which amortizes the rebuilds to O(log n) per query while keeping the
+        brute-force tail scan short; small trees stay on the plain vectorized
+        scan, which is already optimal there
         """
-        distance: float = float(np.linalg.norm(np.array(point) - np.array(self.point)))
-
-        if distance < delta:
-            return point
+        if self.n >= 64 and self.n - self._kd_size > math.isqrt(self.n):
+            from scipy.spatial import cKDTree
 
-        point_limited = (
-            np.array(self.point)
-            + delta * (np.array(point) - np.array(self.point)) / distance
-        )
-        return point_limited  # type: ignore
+            self._kdtree = cKDTree(self._coords[: self.n])
+            self._kd_size = self.n
 
 
 if __name__ == "__main__":